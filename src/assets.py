@@ -11,13 +11,57 @@ mixer.init()
 # Used with os.path.join for cross platform paths
 ASSETPATH = os.path.join('..', 'Assets')
 
-# Load the sounds
-BUT_SOUNDS = [mixer.Sound(os.path.join(ASSETPATH, f'sound{i}.wav')) for i in range(1, 5)]
-WA_SOUND = mixer.Sound(os.path.join(ASSETPATH, 'WA.wav'))
+# Assets are loaded the first time they're asked for, not on import
+_BUT_SOUNDS = [None] * 4
+_OFF_IMGS = [None] * 4
+_ON_IMGS = [None] * 4
 
-# Load the images
-OFF_IMGS = [Fl_PNG_Image(os.path.join(ASSETPATH, f'{i}_hover_off.png')) for i in range(4)]
-ON_IMGS = [Fl_PNG_Image(os.path.join(ASSETPATH, f'{i}_hover_on.png')) for i in range(4)]
+_WA_SOUND = None
+_CENTER_IMG = None
+_DOWN_CENTER_IMG = None
 
-CENTER_IMG = Fl_PNG_Image(os.path.join(ASSETPATH, f'center.png'))
-DOWN_CENTER_IMG = Fl_PNG_Image(os.path.join(ASSETPATH, f'down_center.png'))
\ No newline at end of file
+
+def get_but_sound(i):
+    """Return the sound for button number i."""
+
+    if _BUT_SOUNDS[i] is None:
+        _BUT_SOUNDS[i] = mixer.Sound(os.path.join(ASSETPATH, f'sound{i + 1}.wav'))
+    return _BUT_SOUNDS[i]
+
+def get_wa_sound():
+    """Return the error sound."""
+
+    global _WA_SOUND
+    if _WA_SOUND is None:
+        _WA_SOUND = mixer.Sound(os.path.join(ASSETPATH, 'WA.wav'))
+    return _WA_SOUND
+
+def get_off_img(i):
+    """Return the unlit image for button number i."""
+
+    if _OFF_IMGS[i] is None:
+        _OFF_IMGS[i] = Fl_PNG_Image(os.path.join(ASSETPATH, f'{i}_hover_off.png'))
+    return _OFF_IMGS[i]
+
+def get_on_img(i):
+    """Return the lit image for button number i."""
+
+    if _ON_IMGS[i] is None:
+        _ON_IMGS[i] = Fl_PNG_Image(os.path.join(ASSETPATH, f'{i}_hover_on.png'))
+    return _ON_IMGS[i]
+
+def get_center_img():
+    """Return the start button image."""
+
+    global _CENTER_IMG
+    if _CENTER_IMG is None:
+        _CENTER_IMG = Fl_PNG_Image(os.path.join(ASSETPATH, 'center.png'))
+    return _CENTER_IMG
+
+def get_down_center_img():
+    """Return the pressed start button image."""
+
+    global _DOWN_CENTER_IMG
+    if _DOWN_CENTER_IMG is None:
+        _DOWN_CENTER_IMG = Fl_PNG_Image(os.path.join(ASSETPATH, 'down_center.png'))
+    return _DOWN_CENTER_IMG
@@ -2,6 +2,22 @@ from fltk import *
 
 from assets import *
 
+# Scaled copies of source images shared by all buttons, id(src): (w, h, img)
+# Only the latest size is kept for each source image
+_SCALED = {}
+
+def _get_scaled(src, w, h):
+    """Return src scaled to w by h, reusing the last scaled copy if possible."""
+
+    cached = _SCALED.get(id(src))
+    if cached is not None and cached[:2] == (w, h):
+        return cached[2]
+
+    img = src.copy(w, h)
+    _SCALED[id(src)] = (w, h, img)
+    return img
+
+
 class GameButton(Fl_Button):
     """A subclass of Fl_Button customized specifically to be the main
     buttons in the game Simon.
@@ -33,11 +49,11 @@ class GameButton(Fl_Button):
         self.in_radius = in_radius
         self.in_ratio = self.in_radius / w
         
-        self.OFF_IMG = OFF_IMGS[number]
-        self.ON_IMG = ON_IMGS[number]
+        self.OFF_IMG = get_off_img(number)
+        self.ON_IMG = get_on_img(number)
         self.cur_img = self.OFF_IMG
 
-        self.sound = BUT_SOUNDS[number]
+        self.sound = get_but_sound(number)
         
         self.parentwin = parentwin
         
@@ -45,17 +61,19 @@ class GameButton(Fl_Button):
         
         self.on = False
 
+        # For only recalculating hit detection on resize
+        self._last_size = (0, 0)
+
         self.box(FL_NO_BOX)
         self.clear_visible_focus()
+        self.update_img()
     
     def handle(self, event):
         """Extend Fl_Button handle to add custom circle-based hit detection."""
 
         ret = super().handle(event)
-        
-        x, y, = Fl.event_x(), Fl.event_y()
 
-        if event is FL_PUSH and Fl.event_button1():
+        if event == FL_PUSH and Fl.event_button1():
             x, y, = Fl.event_x(), Fl.event_y()
 
             if not self.point_inside(x, y):
@@ -75,10 +93,12 @@ class GameButton(Fl_Button):
 
         c_x, c_y = self.getcorner() 
 
-        # Good ol pythagorean theorem to get distance between inside corner and click
-        dist = (((c_x - x) **2) + ((c_y - y) **2)) **0.5
+        # Good ol pythagorean theorem, compared squared to skip the square root
+        dx = c_x - x
+        dy = c_y - y
+        d2 = dx*dx + dy*dy
 
-        return self.in_radius < dist < self.radius
+        return self._ir2 < d2 < self._r2
 
     def getcorner(self):
         """Return the x and y of the corner that is in the center of the circle."""
@@ -87,18 +107,22 @@ class GameButton(Fl_Button):
         y = self.y() + (self.h() * self.center[1])
         return x, y 
 
-    def draw(self):
-        """Extend Fl_Button draw to resize image."""
-        self.update_img()
-        super().draw()
-
     def update_img(self):
         """Resize current image to button dimensions, and adjust variables
         for hit detection accordingly."""
 
-        self.image(self.cur_img.copy(self.w(), self.h()))
-        self.radius = self.w()
-        self.in_radius = self.w() * self.in_ratio
+        size = (self.w(), self.h())
+        if size != self._last_size:
+            self._last_size = size
+
+            self.radius = self.w()
+            self.in_radius = self.w() * self.in_ratio
+
+            # Squared radii so hit detection doesn't need a square root
+            self._r2 = self.radius * self.radius
+            self._ir2 = self.in_radius * self.in_radius
+
+        self.image(_get_scaled(self.cur_img, *size))
         self.redraw()
 
     def auto_click(self, duration):
@@ -108,11 +132,11 @@ class GameButton(Fl_Button):
         self.cur_img = self.ON_IMG
         self.update_img()
         
-        self.sound.stop()
-
-        self.sound.play(-1)
+        # Sounds are shorter than a note so loop, but_off fades it out after duration
+        # maxtime is only a backstop in case that timeout gets removed
+        self.sound.play(-1, maxtime=int(duration * 1000) + 45)
 
-        # Stop click after duration seconds
+        # Turn the light off after duration seconds
         Fl.remove_timeout(self.but_off)
         Fl.add_timeout(duration, self.but_off)
 
@@ -127,16 +151,19 @@ class GameButton(Fl_Button):
         self.cur_img = self.OFF_IMG
         self.update_img()
         
-        # Stop the current sound
-        if WA_SOUND.get_num_channels():
-            WA_SOUND.fadeout(45)
-        else:
-            self.sound.fadeout(45)
-        
         # Send the click to answer checking if the user did it
         if manual:
+            # Stop the current sound
+            if get_wa_sound().get_num_channels():
+                get_wa_sound().fadeout(45)
+            else:
+                self.sound.fadeout(45)
+
             self.parentwin.player_ans(self.number)
 
+        else: # Automatic clicks never play the error sound
+            self.sound.fadeout(45)
+
     def manual_click(self):
         """Turn the button on, changing the image and starting the sound."""
 
@@ -147,7 +174,7 @@ class GameButton(Fl_Button):
         if self.parentwin.is_correct(self.number):
             self.sound.play(-1)
         else:
-            WA_SOUND.play(-1)
+            get_wa_sound().play(-1)
             
         self.update_img()
 
@@ -179,18 +206,24 @@ class But_Group(Fl_Group):
         """Resize and reposition according to window size."""
 
         w, h = self.parentwin.w(), self.parentwin.h()
-        if (w, h) != self.parentwin.lastsize: # Dimensions changed
-            
-            # Find the smallest dimension, that's the contraint
-            # Then -80 to account for 40 px margins on each side
-            dim = min(w, h - 30) - 80
+        if (w, h) == self.parentwin.lastsize: # Nothing to do
+            return
 
-            x = (w//2) - (dim//2)
-            y = 30 + ((h - 30)//2) - (dim//2)
-            
+        self.parentwin.lastsize = (w, h)
+
+        # Find the smallest dimension, that's the contraint
+        # Then -80 to account for 40 px margins on each side
+        dim = min(w, h - 30) - 80
+
+        x = (w//2) - (dim//2)
+        y = 30 + ((h - 30)//2) - (dim//2)
+
+        # FLTK may have already put the group in the right place
+        if (x, y, dim, dim) != (self.x(), self.y(), self.w(), self.h()):
             self.resize(x, y, dim, dim)
 
-        self.parentwin.lastsize = (w, h)
+        # Buttons have changed size either way
+        self.parentwin.update_imgs()
 
 
 class StartButton(Fl_Button):
@@ -204,14 +237,15 @@ class StartButton(Fl_Button):
 
         super().__init__(x, y, w, h)
 
-        self.img = CENTER_IMG
-        self.downimg = DOWN_CENTER_IMG
+        self.img = get_center_img()
+        self.downimg = get_down_center_img()
         self.cur_img = self.img
 
         self.parentwin = parentwin
 
         self.box(FL_NO_BOX)
         self.clear_visible_focus()
+        self.update_img()
 
     def update_img(self):
         """Change image to current size.
@@ -219,13 +253,8 @@ class StartButton(Fl_Button):
         Width and height will always be proportional.
         """
 
-        self.image(self.cur_img.copy(self.w(), self.h()))
-    
-    def draw(self):
-        """Extend Fl_Button.draw to resize image."""
-
-        self.update_img()
-        super().draw()
+        self.image(_get_scaled(self.cur_img, self.w(), self.h()))
+        self.redraw()
     
     def handle(self, event):
         """Extend Fl_Button.handle to change image with mouse state.
@@ -235,11 +264,11 @@ class StartButton(Fl_Button):
 
         ret = super().handle(event)
 
-        if event is FL_PUSH:
+        if event == FL_PUSH:
             self.cur_img = self.downimg
             self.update_img()
 
-        if event is FL_RELEASE:
+        if event == FL_RELEASE:
             self.cur_img = self.img
             self.update_img()
 
@@ -1,6 +1,8 @@
+from bisect import bisect_right
 from datetime import datetime
+import json
 import pickle
-from random import randint
+from random import getrandbits
 
 from fltk import *
 
@@ -27,14 +29,21 @@ class SimonGame(Fl_Double_Window):
 
         super().__init__(w, h, title)
 
+        # Scores are only written when changed, see save_scores()
+        self._scores_dirty = False
+
         # Load scores or create file if necessary
         try:
-            with open('.scores.pickle', 'rb') as f:
-                self.scores = pickle.load(f)
-              
+            with open('.scores.json') as f:
+                self.scores = self.checked_scores(Score(**d) for d in json.load(f))
+
         except FileNotFoundError:
+            self.scores = self.load_old_scores()
+
+        # Corrupt score file shouldn't stop the game from starting
+        # (json.JSONDecodeError is a ValueError)
+        except (TypeError, ValueError, OverflowError):
             self.scores = [Score(),]
-            self.save_scores()
 
         self.color(FL_BLACK)
         self.lastsize = (self.w(), self.h())
@@ -42,6 +51,13 @@ class SimonGame(Fl_Double_Window):
         # For keeping track of the sequence, and what the player has entered
         self.sequence = list()
         self.player_seq = list()
+
+        # Index of the next note to play back from the sequence
+        self._pending_idx = 0
+
+        # Buffer of random bits, notes are taken 2 bits at a time
+        self._rng_pool = 0
+        self._rng_bits = 0
         
         # Initial timing for autoplayed notes in sequence, reset in self.stop()
         self.duration = 0.42
@@ -72,27 +88,27 @@ class SimonGame(Fl_Double_Window):
         self.but_group = But_Group(x, y, dim, dim, self)
         self.but_group.begin()
         
+        # Size of each game button, the window is split into quarters inside the margins
+        half_w = w//2 - 40
+        half_h = (h-30)//2 - 40
+
         # Figure out position of start button in center
-        center_x = round(40 + (w//2 - 40) * 0.625)
-        center_y = round(70 + ((h-30)//2 - 40) * 0.625)
-        center_w = round(((w//2 - 40) * 0.375) * 2)
+        center_x = round(40 + half_w * 0.625)
+        center_y = round(70 + half_h * 0.625)
+        center_w = round((half_w * 0.375) * 2)
         self.start_but = StartButton(center_x, center_y, center_w, center_w, self)
 
         self.gamebuttons = list()
 
         # Create main buttons for gameplay
-        corners = [(0, 0), (1, 0), (0, 1), (1, 1)]
-        for i in range(4):
-            corner = corners[i]
+        # Corner for figuring out position vs corner passed for detecting clicks are opposites
+        corners = ((0, 0), (1, 0), (0, 1), (1, 1))
+        anti_corners = ((1, 1), (0, 1), (1, 0), (0, 0))
+        for i, (corner, anti) in enumerate(zip(corners, anti_corners)):
+            b_x = 40 + half_w * corner[0]
+            b_y = 70 + half_h * corner[1]
 
-            # do this outside of gamebutton args to avoid crazy long line
-            b_x = 40 + (w//2 - 40) * corner[0]
-            b_y = 70 + ((h-30)//2 - 40) * corner[1]
-            b_w = w//2 - 40
-            b_h = (h-30)//2 - 40
-
-            # Corner for figuring out position vs corner passed for detecting clicks are opposites
-            self.gamebuttons.append(GameButton(b_x, b_y, b_w, b_h, corners[::-1][i], (w//2 - 40) * 0.4, i, self))
+            self.gamebuttons.append(GameButton(b_x, b_y, half_w, half_h, anti, half_w * 0.4, i, self))
 
         self.but_group.end()
         
@@ -102,6 +118,12 @@ class SimonGame(Fl_Double_Window):
         # Buttons are deactivated untill user starts game
         self.deactivate_buts()
 
+        # Load the error sound once the window is up, instead of on the first click
+        Fl.add_timeout(0, get_wa_sound)
+
+        # Periodically save so a crash doesn't lose too many scores
+        Fl.add_timeout(30, self.autosave)
+
     def new_game(self, wid, data=None):
         """Reset current game if active and start a new one."""
         
@@ -136,10 +158,10 @@ class SimonGame(Fl_Double_Window):
         if timeout:
             self.play_error_sound()
 
+        self.scores_changed()
+
         # Remove default blank score if it's there
-        for s in self.scores.copy():
-            if s.date == 'N/A':
-                self.scores.remove(s)
+        self.scores[:] = [s for s in self.scores if not s.is_default()]
 
         # Add new score to list of scores
         name = fl_input(f'GAME OVER - SCORE {points}\nEnter your name:', 'Anonymous')
@@ -147,10 +169,9 @@ class SimonGame(Fl_Double_Window):
         
         if name is not None:
             score = Score(points, name or 'Anonymous', date)
-            self.scores.append(score)
-            self.scores.sort(key=lambda s: s.value, reverse=True)
+            i = self.insert_score(score)
 
-            self.view_scores(0, self.scores.index(score) + 2)
+            self.view_scores(0, i + 2)
         
         # User pressed cancel or escaped/closed, give them a chance to save score
         else:
@@ -167,14 +188,21 @@ class SimonGame(Fl_Double_Window):
                 else: # Clicked no, save score
                     name = fl_input('LAST CHANCE!\nEnter your name:', 'Anonymous')
                     score = Score(points, name or 'Anonymous', date)
-                    self.scores.append(score)
-                    self.scores.sort(key=lambda s: s.value, reverse=True)
+                    i = self.insert_score(score)
 
-                    self.view_scores(0, self.scores.index(score) + 2)
+                    self.view_scores(0, i + 2)
             
             else:
                 self.view_scores(0)
         
+    def insert_score(self, score):
+        """Insert a score into the sorted list of scores and return its index."""
+
+        # Sorted highest first, new score goes after any equal scores
+        i = bisect_right(self.scores, -score.value, key=lambda s: -s.value)
+        self.scores.insert(i, score)
+        return i
+
     def play_error_sound(self, stop=False):
         """Play the error sound for a set amount of time, then stop it.
         
@@ -183,9 +211,9 @@ class SimonGame(Fl_Double_Window):
         """
 
         if stop:
-            WA_SOUND.stop()
+            get_wa_sound().stop()
         else:
-            WA_SOUND.play(-1)
+            get_wa_sound().play(-1)
             Fl.add_timeout(1.3, self.play_error_sound, True)
         
     def play_seq(self):
@@ -197,7 +225,7 @@ class SimonGame(Fl_Double_Window):
         self.deactivate_buts()
         
         # Add one random button number to sequence
-        self.sequence.append(randint(0, 3))
+        self.sequence.append(self._next_note())
 
         # Speed up playback by set amounts at set points in the game
         if len(self.sequence) == 6:
@@ -207,20 +235,45 @@ class SimonGame(Fl_Double_Window):
             self.duration = 0.26
             self.interval = 0.108
         
-        # Add timeouts for the whole sequence at once
-        for b in range(len(self.sequence)):
-            # Time until next button is duration + interval so that 
-            # there is a gap between playing buttons
-            total_time = (self.duration * b) + (self.interval * b)
-            Fl.add_timeout(total_time, self.gamebuttons[self.sequence[b]].auto_click, self.duration)
-        
-        # Schedule starting the players turn for when the sequence is done
+        # Play the sequence one note at a time from a single timeout
         self.player_seq.clear()
-        seq_time = (self.duration * len(self.sequence)) + (self.interval * len(self.sequence))
-        Fl.add_timeout(seq_time, self.activate_buts)
+        self._pending_idx = 0
+        Fl.add_timeout(0, self._advance_seq)
+
+    def _next_note(self):
+        """Return a random button number, refilling the bit pool when empty."""
+
+        if self._rng_bits < 2:
+            self._rng_pool = getrandbits(128)
+            self._rng_bits = 128
+
+        n = self._rng_pool & 3
+        self._rng_pool >>= 2
+        self._rng_bits -= 2
+        return n
+
+    def _advance_seq(self):
+        """Play the next note of the sequence and schedule the one after.
+        
+        After the last note, begin the players turn.
+        """
+
+        self.gamebuttons[self.sequence[self._pending_idx]].auto_click(self.duration)
+        self._pending_idx += 1
+
+        # Time until next button is duration + interval so that 
+        # there is a gap between playing buttons
+        # repeat_timeout counts from when this timeout was due, so delays don't add up
+        step = self.duration + self.interval
 
-        # Start a countdown so that doing nothing after the turn starts ends game
-        Fl.add_timeout(seq_time + 5, self.gameover, True)
+        if self._pending_idx < len(self.sequence):
+            Fl.repeat_timeout(step, self._advance_seq)
+
+        else: # Sequence is done, start the players turn
+            Fl.repeat_timeout(step, self.activate_buts)
+
+            # Start a countdown so that doing nothing after the turn starts ends game
+            Fl.repeat_timeout(step + 5, self.gameover, True)
    
     def player_ans(self, ans):
         """Receive a button click and check validity, respond accordingly."""
@@ -254,22 +307,24 @@ class SimonGame(Fl_Double_Window):
         per button, and detect wrong answers before a button is released.
         """
         
-        seq = self.player_seq.copy()
-        seq.append(ans)
-        return seq[-1] == self.sequence[len(seq) - 1]
+        i = len(self.player_seq)
+
+        # Sequence already completed, nothing more can be correct
+        if i >= len(self.sequence):
+            return False
+
+        return ans == self.sequence[i]
         
     def remove_timeouts(self):
-        """Stop most active timeouts.
+        """Stop the timeouts for sequence playback, turns and button lights.
         
-        Some of these probably don't need to be stopped but I was getting
-        errors so I figured it doesn't hurt.
+        The error sound's stop timeout is left alone so it still ends.
         """
 
-        Fl.remove_timeout(self.play_seq)
-        Fl.remove_timeout(self.gameover)
-        Fl.remove_timeout(self.activate_buts)
+        for cb in (self.play_seq, self._advance_seq, self.gameover, self.activate_buts):
+            Fl.remove_timeout(cb)
         for b in self.gamebuttons:
-            Fl.remove_timeout(b.auto_click)
+            Fl.remove_timeout(b.but_off)
 
     def view_scores(self, wid, score=None):
         """Create popup window with all previous scores.
@@ -281,10 +336,63 @@ class SimonGame(Fl_Double_Window):
         s_win = Scorewin(self, score)
 
     def save_scores(self):
-        """Save score list to a file."""
+        """Save score list to a file if it has changed since the last save."""
+
+        if not self._scores_dirty:
+            return
+
+        with open('.scores.json', 'w') as f:
+            json.dump([{'value': s.value, 'name': s.name, 'date': s.date} for s in self.scores], f)
+
+        self._scores_dirty = False
+
+    def scores_changed(self):
+        """Mark the score list as modified so the next save writes it."""
+
+        self._scores_dirty = True
+
+    def autosave(self):
+        """Save scores, then schedule the next save in 30 seconds."""
+
+        self.save_scores()
+        Fl.repeat_timeout(30, self.autosave)
+
+    def checked_scores(self, scores):
+        """Return loaded scores as a list sorted highest first.
+        
+        Raises TypeError, ValueError or OverflowError if any score has values that
+        can't be used, eg. a score that isn't a number.
+        """
 
-        with open('.scores.pickle', 'wb') as f:
-            pickle.dump(self.scores, f)
+        scores = [Score(int(s.value), str(s.name), str(s.date)) for s in scores]
+
+        # Keep scores sorted highest first so new ones can be inserted in place
+        scores.sort(key=lambda s: -s.value)
+        return scores
+
+    def load_old_scores(self):
+        """Return scores from the old pickle file, or a default list if there isn't one.
+        
+        Scores used to be pickled, this is only so they aren't lost when
+        switching over to the json file. The json file is only written if
+        there was nothing to migrate or migrating worked, so a pickle that
+        can't be read now is tried again next time.
+        """
+
+        try:
+            with open('.scores.pickle', 'rb') as f:
+                scores = self.checked_scores(pickle.load(f))
+
+        except FileNotFoundError:
+            scores = [Score(),]
+
+        # Unreadable or corrupt pickle, don't overwrite anything
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+                ImportError, TypeError, ValueError, OverflowError):
+            return [Score(),]
+
+        self.scores_changed()
+        return scores
 
     def update_imgs(self):
         """Update resizing of all images according to window size."""
@@ -311,8 +419,12 @@ class SimonGame(Fl_Double_Window):
         for b in self.gamebuttons:
             b.but_off()
 
+        # Fade out every channel at once, but_off() only does that for manual clicks
+        mixer.fadeout(45)
+
     def hide(self):
         """Extend Fl_Window hide to save score before closing."""
         
+        Fl.remove_timeout(self.autosave)
         self.save_scores()
         super().hide()
\ No newline at end of file
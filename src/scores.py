@@ -1,15 +1,30 @@
+from bisect import bisect_left
+from dataclasses import dataclass
+
 from fltk import *
 
+@dataclass(slots=True)
 class Score:
     """Sinple data structure to represent a single score."""
 
-    def __init__(self, value=0, name='N/A', date='N/A'):
-        """Initialize an instance."""
+    value: int = 0
+    name: str = 'N/A'
+    date: str = 'N/A'
+
+    def __setstate__(self, state):
+        """Restore from a pickle, including ones from before Score had slots."""
+
+        # Slotted pickles store (None, slots), old ones store just __dict__
+        if isinstance(state, tuple):
+            state = state[1]
+
+        for attr, val in state.items():
+            setattr(self, attr, val)
+
+    def is_default(self):
+        """Return if this is the blank placeholder score."""
+        return self.date == 'N/A'
 
-        self.value = value
-        self.name = name
-        self.date = date
-     
     def __repr__(self):
         """For debugging."""
         return f'Score([{self.value}, {self.name}, {self.date}])'
@@ -79,16 +94,17 @@ class Scorewin(Fl_Double_Window):
 
         self.score_brows.clear()
 
-        self.score_brows.add(self.columnnames)
+        add = self.score_brows.add
+        add(self.columnnames)
         for s in self.parentwin.scores:
             # \t indicates columns
-            self.score_brows.add(f'{s.value}\t{s.name}\t{s.date}')
+            add(f'{s.value}\t{s.name}\t{s.date}')
 
     def reset_cb(self, wid):
         """Reset all scores."""
 
         self.parentwin.scores = [Score(),]
-        self.parentwin.save_scores()
+        self.parentwin.scores_changed()
         self.add_scores()
     
     def remove_score(self, wid):
@@ -107,6 +123,7 @@ class Scorewin(Fl_Double_Window):
         if choice:
                 # Browser index is essentially 2 based because of column titles.
                 del self.parentwin.scores[self.score_brows.value() - 2]
+                self.parentwin.scores_changed()
                 self.score_brows.remove(self.score_brows.value())
                 
     def brows_cb(self, wid):
@@ -150,10 +167,14 @@ class Col_Resize_Browser(Fl_Hold_Browser):
         self.colsepcolor = FL_BLACK
         self.showcolsep = True
         self.last_curs = FL_CURSOR_DEFAULT
+        self._win = None # Window to set cursor on, found in handle()
         self.drag_col = -1
         self.widths = list()
         self.nowidths = list()
 
+        # Column separator offsets from the left edge, rebuilt when widths change
+        self._col_edges = None
+
         # For wrapping with arrow keys
         self._lastvalue = 0
 
@@ -163,7 +184,7 @@ class Col_Resize_Browser(Fl_Hold_Browser):
         if newcursor == self.last_curs:
             return
         
-        self.window().cursor(newcursor)
+        self._win.cursor(newcursor)
         
         self.last_curs = newcursor
     
@@ -196,17 +217,23 @@ class Col_Resize_Browser(Fl_Hold_Browser):
         if not Fl.event_inside(x, y, w, h):
             return -1
         
-        mousex = Fl.event_x() + self.hposition()
-        colx = self.x()
+        if self._col_edges is None:
+            edges = list()
+            colx = 0
+            for width in self.widths[:-1]:
+                colx += width
+                edges.append(colx)
+            self._col_edges = edges
         
-        for t in range(len(self.widths) - 1):
-            colx += self.widths[t]
-            
-            diff = mousex - colx
-            
-            # Return column number if mouse nearby
-            if -4 <= diff <= 4:
-                return t
+        edges = self._col_edges
+        mousex = Fl.event_x() + self.hposition() - self.x()
+
+        # First separator that isn't too far left of the mouse
+        t = bisect_left(edges, mousex - 4)
+        
+        # Return column number if mouse nearby
+        if t < len(edges) and edges[t] <= mousex + 4:
+            return t
         
         return -1
     
@@ -217,6 +244,7 @@ class Col_Resize_Browser(Fl_Hold_Browser):
         select = self.value()
 
         # Changing textsize() triggers recalc of scrollbars
+        # Fl_Browser_ has no public way to just recalc the content width
         size = self.textsize()
         self.textsize(size + 1)
         self.textsize(size)
@@ -233,6 +261,10 @@ class Col_Resize_Browser(Fl_Hold_Browser):
         # original Col_Resize_Browser
         if not self.showcolsep:
             return super().handle(event)
+
+        # Not in a window yet when created, so get it on the first event
+        if self._win is None:
+            self._win = self.window()
         
         if event == FL_MOVE:
             if self.col_near_mouse() == -1:
@@ -269,8 +301,10 @@ class Col_Resize_Browser(Fl_Hold_Browser):
                     
                     newwidth -= self.widths[t]
                 
-                if newwidth > 0:
+                # Only bother if the column actually changed size
+                if newwidth > 0 and newwidth != self.widths[self.drag_col]:
                     self.widths[self.drag_col] = newwidth
+                    self._col_edges = None
                     # Apply new widths and redraw
                     self.column_widths(tuple(self.widths + [0]))
                     self.recalc_hscroll()